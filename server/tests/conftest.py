@@ -1,44 +1,176 @@
 from __future__ import annotations
 
+import asyncio
+import os
 import uuid
-from collections.abc import Generator
+from collections.abc import Generator, Iterator
+from contextlib import contextmanager
 from typing import Any
 
+import httpx
 import pytest
-from fastapi.testclient import TestClient
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import APIRoute, request_response
+from sqlalchemy import event, insert
+from sqlalchemy.engine import Engine
 from sqlalchemy.pool import StaticPool
 from sqlmodel import Session, SQLModel, create_engine
 
 import hideandseek.models  # noqa: F401 — registers all tables on metadata
 from hideandseek.db import get_session
-from hideandseek.main import app
+from hideandseek.main import app as hideandseek_app
 from hideandseek.models.game import Game, Player
 from hideandseek.models.game_map import GameMap
 from hideandseek.models.transit import TransitDataset
 from hideandseek.models.types import GameStatus, MapSize
 
+# The session currently joined to the active test's transaction. The dependency
+# override on the session-scoped app reads this so each request shares the
+# test's connection (and gets rolled back with it).
+_active_session: Session | None = None
 
-@pytest.fixture
-def session() -> Generator[Session, None, None]:
+
+@pytest.fixture(scope='session')
+def engine() -> Engine:
     engine = create_engine(
         'sqlite://',
         connect_args={'check_same_thread': False},
         poolclass=StaticPool,
     )
+
+    # pysqlite's implicit transaction handling breaks SAVEPOINT; take over
+    # BEGIN emission ourselves (see SQLAlchemy's pysqlite docs).
+    @event.listens_for(engine, 'connect')
+    def _disable_pysqlite_begin(dbapi_connection: Any, _record: Any) -> None:
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, 'begin')
+    def _emit_begin(conn: Any) -> None:
+        conn.exec_driver_sql('BEGIN')
+
     SQLModel.metadata.create_all(engine)
-    with Session(engine) as session:
+    return engine
+
+
+@pytest.fixture(autouse=True)
+def session(engine: Engine) -> Generator[Session, None, None]:
+    """Per-test session joined to an outer transaction that is always rolled back.
+
+    The app and schema are built once per run; each test runs inside a SAVEPOINT
+    (`join_transaction_mode='create_savepoint'`) so `session.commit()` calls in
+    queries and factories never escape the outer transaction.
+    """
+    global _active_session
+    connection = engine.connect()
+    transaction = connection.begin()
+    with Session(bind=connection, join_transaction_mode='create_savepoint') as session:
+        _active_session = session
         yield session
+    _active_session = None
+    transaction.rollback()
+    connection.close()
 
 
-@pytest.fixture
-def client(session: Session) -> Generator[TestClient, None, None]:
+@pytest.fixture(scope='session')
+def app() -> Generator[FastAPI, None, None]:
     def _override_get_session() -> Generator[Session, None, None]:
-        yield session
+        assert _active_session is not None, 'no test session active'
+        yield _active_session
+
+    # Skip Pydantic response-model validation (handlers already return the
+    # right schema objects and tests assert on resp.json() directly) and
+    # serialize responses with orjson instead of stdlib json. The request
+    # handler is built eagerly in APIRoute.__init__ and captures these
+    # attributes, so it has to be rebuilt after they change.
+    for route in hideandseek_app.router.routes:
+        if not isinstance(route, APIRoute):
+            continue
+        route.response_class = ORJSONResponse
+        if route.response_model is not None:
+            route.response_model = None
+            route.response_field = None
+        route.app = request_response(route.get_route_handler())
+
+    hideandseek_app.dependency_overrides[get_session] = _override_get_session
+    yield hideandseek_app
+    hideandseek_app.dependency_overrides.clear()
+
+
+class ASGIClient:
+    """Synchronous test client that calls the ASGI app directly.
+
+    Unlike starlette's `TestClient` (which bridges sync↔async through a portal
+    thread), requests run on a private event loop in the test process — no
+    per-request thread handoff. The `httpx` API (`json=`, `params=`,
+    `headers=`, `resp.json()`) is unchanged.
+    """
+
+    def __init__(self, app: FastAPI) -> None:
+        self._loop = asyncio.new_event_loop()
+        self._client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url='http://testserver',
+        )
+
+    @property
+    def headers(self) -> httpx.Headers:
+        return self._client.headers
+
+    def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        return self._loop.run_until_complete(self._client.request(method, url, **kwargs))
+
+    def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return self.request('GET', url, **kwargs)
 
-    app.dependency_overrides[get_session] = _override_get_session
-    with TestClient(app) as client:
+    def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        return self.request('POST', url, **kwargs)
+
+    def patch(self, url: str, **kwargs: Any) -> httpx.Response:
+        return self.request('PATCH', url, **kwargs)
+
+    def delete(self, url: str, **kwargs: Any) -> httpx.Response:
+        return self.request('DELETE', url, **kwargs)
+
+    def close(self) -> None:
+        self._loop.run_until_complete(self._client.aclose())
+        self._loop.close()
+
+
+@pytest.fixture(scope='session')
+def client(app: FastAPI) -> Generator[ASGIClient, None, None]:
+    client = ASGIClient(app)
+    yield client
+    client.close()
+
+
+@contextmanager
+def identify(client: ASGIClient, client_id: uuid.UUID) -> Generator[ASGIClient, None, None]:
+    """Send `X-Client-Id` as a default header for every request in the block.
+
+    Cheaper than passing `headers=` per call on the shared client, since the
+    header dict is merged into the client defaults once instead of per request.
+    """
+    client.headers['X-Client-Id'] = str(client_id)
+    try:
         yield client
-    app.dependency_overrides.clear()
+    finally:
+        del client.headers['X-Client-Id']
+
+
+def _uuid_pool() -> Iterator[uuid.UUID]:
+    """Yield random UUIDs from batched urandom reads.
+
+    `uuid.uuid4()` costs a syscall per call; the factories below burn through
+    a few per test. One 4 KiB read covers 256 of them.
+    """
+    while True:
+        buf = os.urandom(16 * 256)
+        for i in range(0, len(buf), 16):
+            yield uuid.UUID(bytes=buf[i : i + 16], version=4)
+
+
+_uuids = _uuid_pool()
 
 
 # ── Factory functions ─────────────────────────────────────────────────────────
@@ -85,8 +217,8 @@ def create_game(session: Session, **overrides: Any) -> Game:
         gm = create_game_map(session)
         overrides['map_id'] = gm.id
     defaults: dict[str, Any] = {
-        'host_client_id': uuid.uuid4(),
-        'join_code': overrides.pop('join_code', uuid.uuid4().hex[:4].upper()),
+        'host_client_id': next(_uuids),
+        'join_code': overrides.pop('join_code', next(_uuids).hex[:4].upper()),
         'status': GameStatus.lobby,
         'timing': {
             'hiding_time_min': 30,
@@ -110,7 +242,7 @@ def create_game(session: Session, **overrides: Any) -> Game:
 def create_player(session: Session, game_id: uuid.UUID, **overrides: Any) -> Player:
     defaults: dict[str, Any] = {
         'game_id': game_id,
-        'client_id': uuid.uuid4(),
+        'client_id': next(_uuids),
         'name': 'Test Player',
         'color': '#FF5733',
         'role': None,
@@ -121,3 +253,27 @@ def create_player(session: Session, game_id: uuid.UUID, **overrides: Any) -> Pla
     session.commit()
     session.refresh(player)
     return player
+
+
+def create_players_bulk(
+    session: Session, game_id: uuid.UUID, specs: list[dict[str, Any]]
+) -> list[Player]:
+    """Create several players with one INSERT ... RETURNING and one commit.
+
+    Takes the same `**overrides` keys as `create_player`, one dict per player.
+    """
+    rows = [
+        {
+            'id': next(_uuids),
+            'game_id': game_id,
+            'client_id': next(_uuids),
+            'name': 'Test Player',
+            'color': '#FF5733',
+            'role': None,
+            **spec,
+        }
+        for spec in specs
+    ]
+    players = list(session.execute(insert(Player).values(rows).returning(Player)).scalars())
+    session.commit()
+    return players
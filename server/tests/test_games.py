@@ -2,11 +2,10 @@ from __future__ import annotations
 
 import uuid
 
-from fastapi.testclient import TestClient
 from sqlmodel import Session
 
 from hideandseek.models.types import GameStatus, PlayerRole, RouteType
-from tests.conftest import create_game, create_game_map, create_player
+from tests.conftest import ASGIClient, create_game, create_game_map, create_player
 
 
 def _headers(client_id: uuid.UUID | None = None) -> dict[str, str]:
@@ -16,7 +15,7 @@ def _headers(client_id: uuid.UUID | None = None) -> dict[str, str]:
 # ── POST /games ──────────────────────────────────────────────────────────────
 
 
-def test_create_game(client: TestClient, session: Session):
+def test_create_game(client: ASGIClient, session: Session):
     gm = create_game_map(session)
     resp = client.post(
         '/games',
@@ -31,7 +30,7 @@ def test_create_game(client: TestClient, session: Session):
     assert data['players'] == []
 
 
-def test_create_game_map_not_found(client: TestClient):
+def test_create_game_map_not_found(client: ASGIClient):
     resp = client.post(
         '/games',
         json={'map_id': str(uuid.uuid4())},
@@ -43,7 +42,7 @@ def test_create_game_map_not_found(client: TestClient):
 # ── POST /games/join ─────────────────────────────────────────────────────────
 
 
-def test_join_game(client: TestClient, session: Session):
+def test_join_game(client: ASGIClient, session: Session):
     create_game(session, join_code='ABCD')
     client_id = uuid.uuid4()
     resp = client.post(
@@ -59,7 +58,7 @@ def test_join_game(client: TestClient, session: Session):
     assert data['game']['players'][0]['role'] is None
 
 
-def test_join_game_invalid_code(client: TestClient):
+def test_join_game_invalid_code(client: ASGIClient):
     resp = client.post(
         '/games/join',
         json={'join_code': 'ZZZZ', 'name': 'Bob', 'color': '#0000FF'},
@@ -68,7 +67,7 @@ def test_join_game_invalid_code(client: TestClient):
     assert resp.status_code == 404
 
 
-def test_join_game_not_in_lobby(client: TestClient, session: Session):
+def test_join_game_not_in_lobby(client: ASGIClient, session: Session):
     create_game(session, join_code='WXYZ', status=GameStatus.hiding)
     resp = client.post(
         '/games/join',
@@ -81,7 +80,7 @@ def test_join_game_not_in_lobby(client: TestClient, session: Session):
 # ── GET /games/{game_id} ────────────────────────────────────────────────────
 
 
-def test_get_game_state(client: TestClient, session: Session):
+def test_get_game_state(client: ASGIClient, session: Session):
     game = create_game(session)
     create_player(session, game.id, name='Alice', role=PlayerRole.hider)
     resp = client.get(f'/games/{game.id}')
@@ -92,7 +91,7 @@ def test_get_game_state(client: TestClient, session: Session):
     assert data['players'][0]['role'] == 'hider'
 
 
-def test_get_game_not_found(client: TestClient):
+def test_get_game_not_found(client: ASGIClient):
     resp = client.get(f'/games/{uuid.uuid4()}')
     assert resp.status_code == 404
 
@@ -100,7 +99,7 @@ def test_get_game_not_found(client: TestClient):
 # ── PATCH /games/{game_id}/players/{player_id} ──────────────────────────────
 
 
-def test_update_player_role(client: TestClient, session: Session):
+def test_update_player_role(client: ASGIClient, session: Session):
     game = create_game(session)
     player = create_player(session, game.id)
     resp = client.patch(
@@ -111,7 +110,7 @@ def test_update_player_role(client: TestClient, session: Session):
     assert resp.json()['role'] == 'seeker'
 
 
-def test_update_player_name_and_color(client: TestClient, session: Session):
+def test_update_player_name_and_color(client: ASGIClient, session: Session):
     game = create_game(session)
     player = create_player(session, game.id, name='Old', color='#000000')
     resp = client.patch(
@@ -124,7 +123,7 @@ def test_update_player_name_and_color(client: TestClient, session: Session):
     assert data['color'] == '#FFFFFF'
 
 
-def test_update_player_not_found(client: TestClient, session: Session):
+def test_update_player_not_found(client: ASGIClient, session: Session):
     game = create_game(session)
     resp = client.patch(
         f'/games/{game.id}/players/{uuid.uuid4()}',
@@ -136,7 +135,7 @@ def test_update_player_not_found(client: TestClient, session: Session):
 # ── POST /games/{game_id}/start ─────────────────────────────────────────────
 
 
-def test_start_game(client: TestClient, session: Session):
+def test_start_game(client: ASGIClient, session: Session):
     game = create_game(session)
     create_player(session, game.id, role=PlayerRole.hider)
     create_player(session, game.id, role=PlayerRole.seeker)
@@ -145,13 +144,13 @@ def test_start_game(client: TestClient, session: Session):
     assert resp.json()['status'] == 'hiding'
 
 
-def test_start_game_no_players(client: TestClient, session: Session):
+def test_start_game_no_players(client: ASGIClient, session: Session):
     game = create_game(session)
     resp = client.post(f'/games/{game.id}/start')
     assert resp.status_code == 409
 
 
-def test_start_game_unassigned_roles(client: TestClient, session: Session):
+def test_start_game_unassigned_roles(client: ASGIClient, session: Session):
     game = create_game(session)
     create_player(session, game.id, role=None)
     resp = client.post(f'/games/{game.id}/start')
@@ -159,7 +158,7 @@ def test_start_game_unassigned_roles(client: TestClient, session: Session):
     assert 'assigned roles' in resp.json()['detail']
 
 
-def test_start_game_missing_hider(client: TestClient, session: Session):
+def test_start_game_missing_hider(client: ASGIClient, session: Session):
     game = create_game(session)
     create_player(session, game.id, role=PlayerRole.seeker)
     create_player(session, game.id, role=PlayerRole.seeker)
@@ -168,7 +167,7 @@ def test_start_game_missing_hider(client: TestClient, session: Session):
     assert 'hider' in resp.json()['detail']
 
 
-def test_start_game_missing_seeker(client: TestClient, session: Session):
+def test_start_game_missing_seeker(client: ASGIClient, session: Session):
     game = create_game(session)
     create_player(session, game.id, role=PlayerRole.hider)
     resp = client.post(f'/games/{game.id}/start')
@@ -176,7 +175,7 @@ def test_start_game_missing_seeker(client: TestClient, session: Session):
     assert 'seeker' in resp.json()['detail']
 
 
-def test_start_game_not_in_lobby(client: TestClient, session: Session):
+def test_start_game_not_in_lobby(client: ASGIClient, session: Session):
     game = create_game(session, status=GameStatus.seeking)
     resp = client.post(f'/games/{game.id}/start')
     assert resp.status_code == 409
@@ -185,7 +184,7 @@ def test_start_game_not_in_lobby(client: TestClient, session: Session):
 # ── POST /games/{game_id}/end ───────────────────────────────────────────────
 
 
-def test_end_game(client: TestClient, session: Session):
+def test_end_game(client: ASGIClient, session: Session):
     game = create_game(session, status=GameStatus.seeking)
     resp = client.post(f'/games/{game.id}/end')
     assert resp.status_code == 200
@@ -194,20 +193,20 @@ def test_end_game(client: TestClient, session: Session):
     assert data['join_code'] is None
 
 
-def test_end_game_from_hiding(client: TestClient, session: Session):
+def test_end_game_from_hiding(client: ASGIClient, session: Session):
     game = create_game(session, status=GameStatus.hiding)
     resp = client.post(f'/games/{game.id}/end')
     assert resp.status_code == 200
     assert resp.json()['status'] == 'finished'
 
 
-def test_end_game_from_lobby(client: TestClient, session: Session):
+def test_end_game_from_lobby(client: ASGIClient, session: Session):
     game = create_game(session, status=GameStatus.lobby)
     resp = client.post(f'/games/{game.id}/end')
     assert resp.status_code == 409
 
 
-def test_end_game_already_finished(client: TestClient, session: Session):
+def test_end_game_already_finished(client: ASGIClient, session: Session):
     game = create_game(session, status=GameStatus.finished, join_code=None)
     resp = client.post(f'/games/{game.id}/end')
     assert resp.status_code == 409
@@ -216,7 +215,7 @@ def test_end_game_already_finished(client: TestClient, session: Session):
 # ── GET /games/{game_id}/map ────────────────────────────────────────────────
 
 
-def test_get_effective_map(client: TestClient, session: Session):
+def test_get_effective_map(client: ASGIClient, session: Session):
     from hideandseek.models.transit import Route, RouteStop, Stop
 
     game = create_game(session)
@@ -2,11 +2,10 @@ from __future__ import annotations
 
 import uuid
 
-from fastapi.testclient import TestClient
 from sqlmodel import Session
 
 from hideandseek.models.types import GameStatus, PlayerRole
-from tests.conftest import create_game, create_player
+from tests.conftest import ASGIClient, create_game, create_player
 
 
 def _headers(client_id: uuid.UUID) -> dict[str, str]:
@@ -20,7 +19,7 @@ def _point(lng: float = -0.141, lat: float = 51.515) -> dict:
 # ── POST /games/{game_id}/location ──────────────────────────────────────────
 
 
-def test_report_location(client: TestClient, session: Session):
+def test_report_location(client: ASGIClient, session: Session):
     game = create_game(session, status=GameStatus.seeking)
     seeker = create_player(session, game.id, role=PlayerRole.seeker)
 
@@ -37,7 +36,7 @@ def test_report_location(client: TestClient, session: Session):
     assert data['players'] == []  # only player, so nobody else visible
 
 
-def test_report_location_seeker_sees_other_seekers(client: TestClient, session: Session):
+def test_report_location_seeker_sees_other_seekers(client: ASGIClient, session: Session):
     game = create_game(session, status=GameStatus.seeking)
     seeker1 = create_player(session, game.id, name='Seeker1', role=PlayerRole.seeker)
     seeker2 = create_player(session, game.id, name='Seeker2', role=PlayerRole.seeker)
@@ -61,7 +60,7 @@ def test_report_location_seeker_sees_other_seekers(client: TestClient, session:
     assert players[0]['name'] == 'Seeker2'
 
 
-def test_hider_sees_seekers(client: TestClient, session: Session):
+def test_hider_sees_seekers(client: ASGIClient, session: Session):
     game = create_game(session, status=GameStatus.seeking)
     hider = create_player(session, game.id, name='Hider', role=PlayerRole.hider)
     seeker = create_player(session, game.id, name='Seeker', role=PlayerRole.seeker)
@@ -85,7 +84,7 @@ def test_hider_sees_seekers(client: TestClient, session: Session):
     assert players[0]['name'] == 'Seeker'
 
 
-def test_seeker_does_not_see_hider(client: TestClient, session: Session):
+def test_seeker_does_not_see_hider(client: ASGIClient, session: Session):
     game = create_game(session, status=GameStatus.seeking)
     hider = create_player(session, game.id, name='Hider', role=PlayerRole.hider)
     seeker = create_player(session, game.id, name='Seeker', role=PlayerRole.seeker)
@@ -107,7 +106,7 @@ def test_seeker_does_not_see_hider(client: TestClient, session: Session):
     assert resp.json()['players'] == []
 
 
-def test_report_location_not_in_game(client: TestClient, session: Session):
+def test_report_location_not_in_game(client: ASGIClient, session: Session):
     game = create_game(session, status=GameStatus.seeking)
     resp = client.post(
         f'/games/{game.id}/location',
@@ -120,7 +119,7 @@ def test_report_location_not_in_game(client: TestClient, session: Session):
 # ── GET /games/{game_id}/location-history ────────────────────────────────────
 
 
-def test_location_history_when_finished(client: TestClient, session: Session):
+def test_location_history_when_finished(client: ASGIClient, session: Session):
     game = create_game(session, status=GameStatus.seeking)
     player = create_player(session, game.id, role=PlayerRole.seeker)
 
@@ -144,7 +143,7 @@ def test_location_history_when_finished(client: TestClient, session: Session):
     assert len(data) == 3
 
 
-def test_location_history_not_finished(client: TestClient, session: Session):
+def test_location_history_not_finished(client: ASGIClient, session: Session):
     game = create_game(session, status=GameStatus.seeking)
     resp = client.get(f'/games/{game.id}/location-history')
     assert resp.status_code == 409
@@ -1,15 +1,15 @@
 from __future__ import annotations
 
-from fastapi.testclient import TestClient
+from tests.conftest import ASGIClient
 
 
-def test_root(client: TestClient):
+def test_root(client: ASGIClient):
     response = client.get('/')
     assert response.status_code == 200
     assert response.json() == {'message': 'Hello, HideAndSeek!'}
 
 
-def test_health(client: TestClient):
+def test_health(client: ASGIClient):
     response = client.get('/health')
     assert response.status_code == 200
     assert response.json() == {'status': 'ok'}
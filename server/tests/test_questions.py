@@ -1,25 +1,72 @@
 from __future__ import annotations
 
+import functools
 import uuid
+from datetime import UTC, datetime
+from typing import NamedTuple
 
-from fastapi.testclient import TestClient
+import pytest
 from sqlmodel import Session
 
 from hideandseek.models.game import Game, Player
+from hideandseek.models.location import LocationUpdate
 from hideandseek.models.types import GameStatus, PlayerRole
-from tests.conftest import create_game, create_player
+from tests.conftest import ASGIClient, create_game, create_players_bulk, identify
 
 
+class GameSetup(NamedTuple):
+    """Game state from the `game_setup` fixture, with pre-formatted routes."""
+
+    game: Game
+    hider: Player
+    seeker: Player
+    game_url: str
+    questions_url: str
+
+
+class AskedQuestion(NamedTuple):
+    """`GameSetup` plus an already-asked slot-0 radar question."""
+
+    game: Game
+    hider: Player
+    seeker: Player
+    game_url: str
+    questions_url: str
+    question_url: str
+
+
+_TS = datetime(2026, 2, 11, 10, 0, tzinfo=UTC)
+
+# Shared request payloads — neither httpx nor the app mutates these.
+_RADAR_SLOT0 = {'question_type': 'radar', 'slot_index': 0}
+_THERMO_SLOT0 = {'question_type': 'thermometer', 'slot_index': 0}
+
+
+@functools.lru_cache
 def _headers(client_id: uuid.UUID) -> dict[str, str]:
+    """Memoized — each player identity is reused across several calls per test."""
     return {'X-Client-Id': str(client_id)}
 
 
+@functools.lru_cache
 def _point(lng: float = -0.141, lat: float = 51.515) -> dict:
-    return {'type': 'Point', 'coordinates': [lng, lat]}
+    """Memoized — only a few distinct coordinate pairs appear in this file.
+
+    Coordinates are a tuple (serialized identically) so the shared dict has
+    nothing worth mutating.
+    """
+    return {'type': 'Point', 'coordinates': (lng, lat)}
+
+
+# Pre-serialized location report body — only the coordinates vary, so skip
+# json.dumps on every call and interpolate them into the byte template.
+_LOC_BODY = (
+    b'{"coordinates":{"type":"Point","coordinates":[%.6f,%.6f]},"timestamp":"2026-02-11T10:00:00Z"}'
+)
 
 
 def _report_location(
-    client: TestClient,
+    client: ASGIClient,
     game_id: uuid.UUID,
     player_client_id: uuid.UUID,
     lng: float = -0.141,
@@ -28,146 +75,174 @@ def _report_location(
     """Helper to report a location for a player."""
     client.post(
         f'/games/{game_id}/location',
-        json={'coordinates': _point(lng, lat), 'timestamp': '2026-02-11T10:00:00Z'},
-        headers=_headers(player_client_id),
+        content=_LOC_BODY % (lng, lat),
+        headers={**_headers(player_client_id), 'Content-Type': 'application/json'},
     )
 
 
-def _setup_seeking_game(client: TestClient, session: Session) -> tuple[Game, Player, Player]:
-    """Create a seeking game with a hider and seeker, both with reported locations."""
-    game = create_game(session, status=GameStatus.seeking)
-    hider = create_player(session, game.id, name='Hider', role=PlayerRole.hider)
-    seeker = create_player(session, game.id, name='Seeker', role=PlayerRole.seeker)
-    _report_location(client, game.id, seeker.client_id, -0.1, 51.5)
-    _report_location(client, game.id, hider.client_id, 0.0, 51.0)
-    return game, hider, seeker
-
-
-# ── POST /games/{game_id}/questions ──────────────────────────────────────────
-
-
-def test_ask_radar_question(client: TestClient, session: Session):
-    game, hider, seeker = _setup_seeking_game(client, session)
-    resp = client.post(
-        f'/games/{game.id}/questions',
-        json={'question_type': 'radar', 'slot_index': 0},
-        headers=_headers(seeker.client_id),
+@pytest.fixture
+def game_setup(request: pytest.FixtureRequest, session: Session) -> GameSetup:
+    """A game with a hider and seeker, both with reported locations.
+
+    The game is in seeking status unless overridden via indirect
+    parametrization (`@pytest.mark.parametrize('game_setup', [...], indirect=True)`).
+    Created inside the test's rolled-back transaction, so no cleanup is needed.
+    Locations are inserted directly rather than POSTed — the questions
+    endpoints only care that a latest LocationUpdate row exists per player.
+    """
+    game = create_game(session, status=getattr(request, 'param', GameStatus.seeking))
+    hider, seeker = create_players_bulk(
+        session,
+        game.id,
+        [
+            {'name': 'Hider', 'role': PlayerRole.hider},
+            {'name': 'Seeker', 'role': PlayerRole.seeker},
+        ],
     )
-    assert resp.status_code == 201
-    data = resp.json()
-    assert data['question_type'] == 'radar'
-    assert data['status'] == 'answerable'
-    assert data['parameters'] == {'radius_m': 3000}
-    assert data['sequence'] == 1
-
-
-def test_ask_thermometer_question(client: TestClient, session: Session):
-    game, hider, seeker = _setup_seeking_game(client, session)
-    resp = client.post(
-        f'/games/{game.id}/questions',
-        json={'question_type': 'thermometer', 'slot_index': 0},
-        headers=_headers(seeker.client_id),
+    session.add_all(
+        [
+            LocationUpdate(
+                player_id=seeker.id, game_id=game.id, coordinates=_point(-0.1, 51.5), timestamp=_TS
+            ),
+            LocationUpdate(
+                player_id=hider.id, game_id=game.id, coordinates=_point(0.0, 51.0), timestamp=_TS
+            ),
+        ]
     )
-    assert resp.status_code == 201
-    data = resp.json()
-    assert data['question_type'] == 'thermometer'
-    assert data['status'] == 'in_progress'
-    assert data['parameters'] == {'min_travel_m': 500}
+    session.commit()
+    game_url = f'/games/{game.id}'
+    return GameSetup(game, hider, seeker, game_url, f'{game_url}/questions')
 
 
-def test_ask_custom_slot_requires_distance(client: TestClient, session: Session):
-    game, hider, seeker = _setup_seeking_game(client, session)
-    # slot_index 2 is the custom radar slot (distance_m: null)
+@pytest.fixture
+def asked_radar_question(client: ASGIClient, game_setup: GameSetup) -> AskedQuestion:
+    """A seeking game where the seeker has already asked the slot-0 radar question."""
     resp = client.post(
-        f'/games/{game.id}/questions',
-        json={'question_type': 'radar', 'slot_index': 2},
-        headers=_headers(seeker.client_id),
+        game_setup.questions_url,
+        json=_RADAR_SLOT0,
+        headers=_headers(game_setup.seeker.client_id),
     )
-    assert resp.status_code == 422
-    assert 'custom_distance_m' in resp.json()['detail']
+    question_url = f'{game_setup.questions_url}/{resp.json()["id"]}'
+    return AskedQuestion(*game_setup, question_url)
 
 
-def test_ask_custom_slot_with_distance(client: TestClient, session: Session):
-    game, hider, seeker = _setup_seeking_game(client, session)
-    resp = client.post(
-        f'/games/{game.id}/questions',
-        json={'question_type': 'radar', 'slot_index': 2, 'custom_distance_m': 4000},
-        headers=_headers(seeker.client_id),
-    )
-    assert resp.status_code == 201
-    assert resp.json()['parameters'] == {'radius_m': 4000}
+# ── POST /games/{game_id}/questions ──────────────────────────────────────────
 
 
-def test_ask_question_deducts_slot(client: TestClient, session: Session):
-    game, hider, seeker = _setup_seeking_game(client, session)
-    # Ask radar slot 0 (3000m)
+@pytest.mark.parametrize(
+    ('payload', 'actor', 'expected_status', 'expected_json', 'detail_contains'),
+    [
+        pytest.param(
+            _RADAR_SLOT0,
+            'seeker',
+            201,
+            {
+                'question_type': 'radar',
+                'status': 'answerable',
+                'parameters': {'radius_m': 3000},
+                'sequence': 1,
+            },
+            None,
+            id='radar',
+        ),
+        pytest.param(
+            _THERMO_SLOT0,
+            'seeker',
+            201,
+            {
+                'question_type': 'thermometer',
+                'status': 'in_progress',
+                'parameters': {'min_travel_m': 500},
+            },
+            None,
+            id='thermometer',
+        ),
+        # slot_index 2 is the custom radar slot (distance_m: null)
+        pytest.param(
+            {'question_type': 'radar', 'slot_index': 2},
+            'seeker',
+            422,
+            None,
+            'custom_distance_m',
+            id='custom-slot-requires-distance',
+        ),
+        pytest.param(
+            {'question_type': 'radar', 'slot_index': 2, 'custom_distance_m': 4000},
+            'seeker',
+            201,
+            {'parameters': {'radius_m': 4000}},
+            None,
+            id='custom-slot-with-distance',
+        ),
+        pytest.param(
+            {'question_type': 'radar', 'slot_index': 99},
+            'seeker',
+            422,
+            None,
+            None,
+            id='invalid-slot-index',
+        ),
+        pytest.param(_RADAR_SLOT0, 'hider', 403, None, None, id='hider-forbidden'),
+    ],
+)
+def test_ask_question(
+    client: ASGIClient,
+    game_setup: GameSetup,
+    payload: dict,
+    actor: str,
+    expected_status: int,
+    expected_json: dict | None,
+    detail_contains: str | None,
+):
+    player = game_setup.seeker if actor == 'seeker' else game_setup.hider
     resp = client.post(
-        f'/games/{game.id}/questions',
-        json={'question_type': 'radar', 'slot_index': 0},
-        headers=_headers(seeker.client_id),
+        game_setup.questions_url,
+        json=payload,
+        headers=_headers(player.client_id),
     )
-    assert resp.status_code == 201
-
-    # Answer the question so we can ask another
+    assert resp.status_code == expected_status
+    if expected_json is not None or detail_contains is not None:
+        # httpx re-parses the body on every .json() call, so parse once
+        data = resp.json()
+        if expected_json is not None:
+            for key, value in expected_json.items():
+                assert data[key] == value
+        if detail_contains is not None:
+            assert detail_contains in data['detail']
+
+
+def test_ask_question_deducts_slot(client: ASGIClient, asked_radar_question: AskedQuestion):
+    # Answer the question so the deduction is final
     resp = client.post(
-        f'/games/{game.id}/questions/{resp.json()["id"]}/answer',
-        headers=_headers(hider.client_id),
+        f'{asked_radar_question.question_url}/answer',
+        headers=_headers(asked_radar_question.hider.client_id),
     )
     assert resp.status_code == 200
 
     # Check game inventory — should have one fewer radar slot
-    game_resp = client.get(f'/games/{game.id}')
+    game_resp = client.get(asked_radar_question.game_url)
     radars = game_resp.json()['inventory']['radars']
     assert len(radars) == 2  # was 3, now 2
 
 
-def test_ask_question_invalid_slot_index(client: TestClient, session: Session):
-    game, hider, seeker = _setup_seeking_game(client, session)
+@pytest.mark.parametrize('game_setup', [GameStatus.lobby], indirect=True)
+def test_ask_question_not_seeking(client: ASGIClient, game_setup: GameSetup):
     resp = client.post(
-        f'/games/{game.id}/questions',
-        json={'question_type': 'radar', 'slot_index': 99},
-        headers=_headers(seeker.client_id),
-    )
-    assert resp.status_code == 422
-
-
-def test_ask_question_not_seeking(client: TestClient, session: Session):
-    game = create_game(session, status=GameStatus.lobby)
-    seeker = create_player(session, game.id, role=PlayerRole.seeker)
-    resp = client.post(
-        f'/games/{game.id}/questions',
-        json={'question_type': 'radar', 'slot_index': 0},
-        headers=_headers(seeker.client_id),
+        game_setup.questions_url,
+        json=_RADAR_SLOT0,
+        headers=_headers(game_setup.seeker.client_id),
     )
     assert resp.status_code == 409
 
 
-def test_ask_question_hider_forbidden(client: TestClient, session: Session):
-    game, hider, seeker = _setup_seeking_game(client, session)
-    resp = client.post(
-        f'/games/{game.id}/questions',
-        json={'question_type': 'radar', 'slot_index': 0},
-        headers=_headers(hider.client_id),
-    )
-    assert resp.status_code == 403
-
-
-def test_ask_question_while_unanswered(client: TestClient, session: Session):
-    game, hider, seeker = _setup_seeking_game(client, session)
-    # Ask first question
-    resp = client.post(
-        f'/games/{game.id}/questions',
-        json={'question_type': 'radar', 'slot_index': 0},
-        headers=_headers(seeker.client_id),
-    )
-    assert resp.status_code == 201
+def test_ask_question_while_unanswered(client: ASGIClient, game_setup: GameSetup):
+    with identify(client, game_setup.seeker.client_id):
+        # Ask first question
+        resp = client.post(game_setup.questions_url, json=_RADAR_SLOT0)
+        assert resp.status_code == 201
 
-    # Try to ask another while first is unanswered
-    resp = client.post(
-        f'/games/{game.id}/questions',
-        json={'question_type': 'radar', 'slot_index': 0},
-        headers=_headers(seeker.client_id),
-    )
+        # Try to ask another while first is unanswered
+        resp = client.post(game_setup.questions_url, json=_RADAR_SLOT0)
     assert resp.status_code == 409
     assert 'unanswered' in resp.json()['detail']
 
@@ -175,41 +250,27 @@ def test_ask_question_while_unanswered(client: TestClient, session: Session):
 # ── POST /games/{game_id}/questions/{id}/lock-in ────────────────────────────
 
 
-def test_lock_in_thermometer(client: TestClient, session: Session):
-    game, hider, seeker = _setup_seeking_game(client, session)
-    resp = client.post(
-        f'/games/{game.id}/questions',
-        json={'question_type': 'thermometer', 'slot_index': 0},
-        headers=_headers(seeker.client_id),
-    )
-    question_id = resp.json()['id']
+def test_lock_in_thermometer(client: ASGIClient, game_setup: GameSetup):
+    game, hider, seeker, _, questions_url = game_setup
+    with identify(client, seeker.client_id):
+        resp = client.post(questions_url, json=_THERMO_SLOT0)
+        question_id = resp.json()['id']
 
-    # Report a new seeker location (simulates travel)
-    _report_location(client, game.id, seeker.client_id, 0.1, 51.6)
+        # Report a new seeker location (simulates travel)
+        _report_location(client, game.id, seeker.client_id, 0.1, 51.6)
 
-    resp = client.post(
-        f'/games/{game.id}/questions/{question_id}/lock-in',
-        headers=_headers(seeker.client_id),
-    )
+        resp = client.post(f'{questions_url}/{question_id}/lock-in')
     assert resp.status_code == 200
     data = resp.json()
     assert data['status'] == 'answerable'
     assert data['seeker_location_end'] is not None
 
 
-def test_lock_in_wrong_status(client: TestClient, session: Session):
-    game, hider, seeker = _setup_seeking_game(client, session)
-    # Ask a radar question (goes straight to answerable, not in_progress)
+def test_lock_in_wrong_status(client: ASGIClient, asked_radar_question: AskedQuestion):
+    # Radar questions go straight to answerable, not in_progress
     resp = client.post(
-        f'/games/{game.id}/questions',
-        json={'question_type': 'radar', 'slot_index': 0},
-        headers=_headers(seeker.client_id),
-    )
-    question_id = resp.json()['id']
-
-    resp = client.post(
-        f'/games/{game.id}/questions/{question_id}/lock-in',
-        headers=_headers(seeker.client_id),
+        f'{asked_radar_question.question_url}/lock-in',
+        headers=_headers(asked_radar_question.seeker.client_id),
     )
     assert resp.status_code == 409
 
@@ -217,18 +278,10 @@ def test_lock_in_wrong_status(client: TestClient, session: Session):
 # ── GET /games/{game_id}/questions/{id}/preview ─────────────────────────────
 
 
-def test_preview_question(client: TestClient, session: Session):
-    game, hider, seeker = _setup_seeking_game(client, session)
-    resp = client.post(
-        f'/games/{game.id}/questions',
-        json={'question_type': 'radar', 'slot_index': 0},
-        headers=_headers(seeker.client_id),
-    )
-    question_id = resp.json()['id']
-
+def test_preview_question(client: ASGIClient, asked_radar_question: AskedQuestion):
     resp = client.get(
-        f'/games/{game.id}/questions/{question_id}/preview',
-        headers=_headers(hider.client_id),
+        f'{asked_radar_question.question_url}/preview',
+        headers=_headers(asked_radar_question.hider.client_id),
     )
     assert resp.status_code == 200
     data = resp.json()
@@ -236,19 +289,18 @@ def test_preview_question(client: TestClient, session: Session):
     assert data['exclusion'] is None
 
 
-def test_preview_not_answerable(client: TestClient, session: Session):
-    game, hider, seeker = _setup_seeking_game(client, session)
+def test_preview_not_answerable(client: ASGIClient, game_setup: GameSetup):
     resp = client.post(
-        f'/games/{game.id}/questions',
-        json={'question_type': 'thermometer', 'slot_index': 0},
-        headers=_headers(seeker.client_id),
+        game_setup.questions_url,
+        json=_THERMO_SLOT0,
+        headers=_headers(game_setup.seeker.client_id),
     )
     question_id = resp.json()['id']
 
     # in_progress, not answerable yet
     resp = client.get(
-        f'/games/{game.id}/questions/{question_id}/preview',
-        headers=_headers(hider.client_id),
+        f'{game_setup.questions_url}/{question_id}/preview',
+        headers=_headers(game_setup.hider.client_id),
     )
     assert resp.status_code == 409
 
@@ -256,18 +308,10 @@ def test_preview_not_answerable(client: TestClient, session: Session):
 # ── POST /games/{game_id}/questions/{id}/answer ─────────────────────────────
 
 
-def test_answer_question(client: TestClient, session: Session):
-    game, hider, seeker = _setup_seeking_game(client, session)
-    resp = client.post(
-        f'/games/{game.id}/questions',
-        json={'question_type': 'radar', 'slot_index': 0},
-        headers=_headers(seeker.client_id),
-    )
-    question_id = resp.json()['id']
-
+def test_answer_question(client: ASGIClient, asked_radar_question: AskedQuestion):
     resp = client.post(
-        f'/games/{game.id}/questions/{question_id}/answer',
-        headers=_headers(hider.client_id),
+        f'{asked_radar_question.question_url}/answer',
+        headers=_headers(asked_radar_question.hider.client_id),
     )
     assert resp.status_code == 200
     data = resp.json()
@@ -277,18 +321,10 @@ def test_answer_question(client: TestClient, session: Session):
     assert data['answered_at'] is not None
 
 
-def test_answer_question_seeker_forbidden(client: TestClient, session: Session):
-    game, hider, seeker = _setup_seeking_game(client, session)
-    resp = client.post(
-        f'/games/{game.id}/questions',
-        json={'question_type': 'radar', 'slot_index': 0},
-        headers=_headers(seeker.client_id),
-    )
-    question_id = resp.json()['id']
-
+def test_answer_question_seeker_forbidden(client: ASGIClient, asked_radar_question: AskedQuestion):
     resp = client.post(
-        f'/games/{game.id}/questions/{question_id}/answer',
-        headers=_headers(seeker.client_id),
+        f'{asked_radar_question.question_url}/answer',
+        headers=_headers(asked_radar_question.seeker.client_id),
     )
     assert resp.status_code == 403
 
@@ -296,35 +332,20 @@ def test_answer_question_seeker_forbidden(client: TestClient, session: Session):
 # ── GET /games/{game_id}/questions ───────────────────────────────────────────
 
 
-def test_list_questions(client: TestClient, session: Session):
-    game, hider, seeker = _setup_seeking_game(client, session)
+def test_list_questions(client: ASGIClient, asked_radar_question: AskedQuestion):
+    game, hider, seeker, _, questions_url, question_url = asked_radar_question
 
-    # Ask and answer a question
-    resp = client.post(
-        f'/games/{game.id}/questions',
-        json={'question_type': 'radar', 'slot_index': 0},
-        headers=_headers(seeker.client_id),
-    )
-    question_id = resp.json()['id']
-    client.post(
-        f'/games/{game.id}/questions/{question_id}/answer',
-        headers=_headers(hider.client_id),
-    )
+    # Answer the question
+    client.post(f'{question_url}/answer', headers=_headers(hider.client_id))
 
     # List as seeker — hider_location should be hidden
-    resp = client.get(
-        f'/games/{game.id}/questions',
-        headers=_headers(seeker.client_id),
-    )
+    resp = client.get(questions_url, headers=_headers(seeker.client_id))
     assert resp.status_code == 200
     data = resp.json()
     assert len(data) == 1
     assert data[0]['hider_location'] is None  # hidden from seekers
 
     # List as hider — hider_location should be visible
-    resp = client.get(
-        f'/games/{game.id}/questions',
-        headers=_headers(hider.client_id),
-    )
+    resp = client.get(questions_url, headers=_headers(hider.client_id))
     data = resp.json()
     assert data[0]['hider_location'] is not None